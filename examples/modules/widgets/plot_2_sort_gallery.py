@@ -24,21 +24,18 @@ w_rs = sw.plot_rasters(sorting)
 # plot_isi_distribution()
 # ~~~~~~~~~~~~~~~~~~~~~~~~
 
-#TODO : @alessio: this is for you
-#w_isi = sw.plot_isi_distribution(sorting, bins=10, window=1)
+w_isi = sw.plot_isi_distribution(sorting, window_ms=150.0, bin_ms=5.0)
 
 ##############################################################################
 # plot_autocorrelograms()
 # ~~~~~~~~~~~~~~~~~~~~~~~~
 
-#TODO : @alessio: this is for you
-# w_ach = sw.plot_autocorrelograms(sorting, bin_size=1, window=10, unit_ids=[1, 2, 4, 5, 8, 10, 7])
+w_ach = sw.plot_autocorrelograms(sorting, window_ms=150.0, bin_ms=5.0, unit_ids=[1, 2, 5])
 
 ##############################################################################
 # plot_crosscorrelograms()
 # ~~~~~~~~~~~~~~~~~~~~~~~~
 
-#TODO : @alessio: this is for you
-# w_cch = sw.plot_crosscorrelograms(sorting, unit_ids=[1, 5, 8], bin_size=0.1, window=5)
+w_cch = sw.plot_crosscorrelograms(sorting, unit_ids=[1, 5, 8], window_ms=150.0, bin_ms=5.0)
 
 plt.show()
\ No newline at end of file
@@ -241,16 +241,18 @@ class BaseRecording(BaseExtractor):
         keep = arr['device_channel_indices'] >= 0
         if np.any(~keep):
             warn('The given probes have unconnected contacts: they are removed')
+            arr = arr[keep]
 
-        arr = arr[keep]
         inds = arr['device_channel_indices']
-        order = np.argsort(inds)
-        inds = inds[order]
         # check
         if np.max(inds) >= self.get_num_channels():
             raise ValueError('The given Probe have "device_channel_indices" that do not match channel count')
+        # most of the time contacts are already ordered: avoid copying the contact vector
+        if np.any(np.diff(inds) < 0):
+            order = np.argsort(inds)
+            inds = inds[order]
+            arr = arr[order]
         new_channel_ids = self.get_channel_ids()[inds]
-        arr = arr[order]
 
         # create recording : channel slice or clone or self
         if in_place:
@@ -1,7 +1,10 @@
 """
 Some simple function to retrieve public datasets.
 """
-
+import shutil
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from .default_folders import get_global_dataset_folder, is_set_global_dataset_folder
 
@@ -15,16 +18,39 @@ except:
 
 def download_dataset(repo=None, remote_path=None, local_folder=None, update_if_exists=False):
     if repo is None:
-        # print('Use gin NeuralEnsemble/ephy_testing_data')
+        # print('Use gin NeuralEnsemble/ephy_testing_data')
         repo = 'https://gin.g-node.org/NeuralEnsemble/ephy_testing_data'
     
     if local_folder is None:
         base_local_folder = get_global_dataset_folder()
         base_local_folder.mkdir(exist_ok=True)
-        # if not is_set_global_dataset_folder():
-            # print(f'Local folder is {base_local_folder}, Use set_global_dataset_folder() to set it globaly')
+        # if not is_set_global_dataset_folder():
+            # print(f'Local folder is {base_local_folder}, Use set_global_dataset_folder() to set it globaly')
         local_folder = base_local_folder / repo.split('/')[-1]
-    
+    local_folder = Path(local_folder)
+
+    if remote_path is not None and not update_if_exists:
+        # the sentinel is written only once a download is complete:
+        # in that case no network round-trip is needed
+        local_path = local_folder / remote_path
+        if local_path.exists() and _get_sentinel_path(local_folder, remote_path).exists():
+            return local_path
+
+    if not HAVE_DATALAD:
+        # without datalad only single files can be downloaded from the gin "raw" http url
+        assert remote_path is not None, 'Without datalad you have to provide "remote_path"'
+        # folders are guessed from the lack of file extension: extension-less files
+        # are also considered as folders and need datalad
+        assert Path(remote_path).suffix != '', \
+            f'Without datalad only files with an extension can be downloaded, {remote_path} has no extension '\
+            'so it is considered as a folder: install datalad'
+        local_path = local_folder / remote_path
+        if not local_path.exists() or update_if_exists:
+            url = f'{repo}/raw/master/{remote_path}'
+            _parallel_download(url, local_path)
+        _get_sentinel_path(local_folder, remote_path).touch()
+        return local_path
+
     if local_folder.exists():
         dataset = datalad.api.Dataset(path=local_folder)
         if update_if_exists:
@@ -39,5 +65,56 @@ def download_dataset(repo=None, remote_path=None, local_folder=None, update_if_e
     dataset.get(remote_path)
     
     local_path = local_folder / remote_path
+    _get_sentinel_path(local_folder, remote_path).touch()
 
     return local_path
+
+
+def _get_sentinel_path(local_folder, remote_path):
+    # the sentinel is put next to local_folder to not pollute the datalad dataset
+    name = str(remote_path).strip('/').replace('/', '_')
+    return local_folder.parent / f'.{local_folder.name}_{name}.complete'
+
+
+def _parallel_download(url, local_path, num_chunks=8, timeout=60):
+    """
+    Download url into local_path with num_chunks concurrent http range requests.
+    Fall back to a single stream when the server does not support byte ranges.
+    """
+    local_path = Path(local_path)
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = local_path.with_name(local_path.name + '.part')
+
+    request = urllib.request.Request(url, method='HEAD')
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        size = int(response.headers.get('Content-Length', 0))
+        accept_ranges = response.headers.get('Accept-Ranges', '') == 'bytes'
+
+    chunk_size = 1024 * 1024
+
+    def _download_range(start, stop):
+        request = urllib.request.Request(url, headers={'Range': f'bytes={start}-{stop - 1}'})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            assert response.status == 206, f'Range request not honored for {url}'
+            with open(tmp_path, 'r+b') as f:
+                f.seek(start)
+                shutil.copyfileobj(response, f, length=chunk_size)
+
+    try:
+        if not accept_ranges or size < num_chunks * chunk_size:
+            with urllib.request.urlopen(url, timeout=timeout) as response, open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response, f, length=chunk_size)
+        else:
+            with open(tmp_path, 'wb') as f:
+                f.truncate(size)
+            bounds = [size * i // num_chunks for i in range(num_chunks + 1)]
+            with ThreadPoolExecutor(max_workers=num_chunks) as executor:
+                futures = [executor.submit(_download_range, start, stop)
+                           for start, stop in zip(bounds[:-1], bounds[1:])]
+                for future in futures:
+                    future.result()
+        tmp_path.replace(local_path)
+    finally:
+        # a failed download do not leave a partial file behind
+        if tmp_path.exists():
+            tmp_path.unlink()
@@ -1,10 +1,16 @@
 import shutil
+import http.server
+import threading
+import os
+import re
 from pathlib import Path
 import pytest
 import numpy as np
 
 
 from spikeinterface.core import download_dataset
+from spikeinterface.core import datasets
+from spikeinterface.core.datasets import _parallel_download, _get_sentinel_path
 
 
 
@@ -16,13 +22,129 @@ def test_download_dataset():
     # local_folder automatic
     local_path = download_dataset(repo=repo, remote_path=remote_path, local_folder=None)
     # print(local_path)
-    
-    
-    
-    
-    
+    assert local_path.exists()
+
+
+class _FakeDatalad:
+    """
+    Minimal datalad.api replacement that records the calls.
+    """
+    def __init__(self):
+        self.calls = []
+        self.api = self
+
+    def Dataset(self, path):
+        self.calls.append('Dataset')
+        return self
+
+    def install(self, path, source):
+        self.calls.append('install')
+        return self
+
+    def update(self, merge):
+        self.calls.append('update')
+
+    def get(self, remote_path):
+        self.calls.append('get')
+
+
+def test_download_dataset_sentinel(monkeypatch):
+    local_folder = Path('dataset_sentinel') / 'ephy_testing_data'
+    if local_folder.parent.is_dir():
+        shutil.rmtree(local_folder.parent)
+    remote_path = 'mearec/mearec_test_10s.h5'
+    local_path = local_folder / remote_path
+    local_path.parent.mkdir(parents=True)
+    local_path.write_bytes(b'mearec')
+
+    fake_datalad = _FakeDatalad()
+    monkeypatch.setattr(datasets, 'HAVE_DATALAD', True)
+    monkeypatch.setattr(datasets, 'datalad', fake_datalad, raising=False)
+
+    # without sentinel datalad is used and the sentinel is written
+    sentinel = _get_sentinel_path(local_folder, remote_path)
+    assert not sentinel.exists()
+    assert download_dataset(remote_path=remote_path, local_folder=local_folder) == local_path
+    assert fake_datalad.calls == ['Dataset', 'get']
+    assert sentinel.exists()
+
+    # with sentinel: no datalad/network call at all
+    fake_datalad.calls.clear()
+    assert download_dataset(remote_path=remote_path, local_folder=local_folder) == local_path
+    assert fake_datalad.calls == []
+
+    # update_if_exists ignores the sentinel
+    download_dataset(remote_path=remote_path, local_folder=local_folder, update_if_exists=True)
+    assert fake_datalad.calls == ['Dataset', 'update', 'get']
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    data = os.urandom(9 * 1024 * 1024 + 123)
+    accept_ranges = True
+    honor_ranges = True
+    range_requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(self.data)))
+        if self.accept_ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+    def do_GET(self):
+        range_header = self.headers.get('Range')
+        if range_header is not None and self.honor_ranges:
+            start, stop = map(int, re.match(r'bytes=(\d+)-(\d+)', range_header).groups())
+            self.range_requests.append((start, stop))
+            body = self.data[start:stop + 1]
+            self.send_response(206)
+        else:
+            body = self.data
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def test_parallel_download():
+    folder = Path('parallel_download')
+    if folder.is_dir():
+        shutil.rmtree(folder)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _RangeRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/file.bin'
+    handler = _RangeRequestHandler
+    try:
+        # ranged download
+        _parallel_download(url, folder / 'ranged.bin', num_chunks=8)
+        assert (folder / 'ranged.bin').read_bytes() == handler.data
+        assert len(handler.range_requests) == 8
+
+        # single stream fallback when the server do not support byte ranges
+        handler.accept_ranges = False
+        handler.range_requests.clear()
+        _parallel_download(url, folder / 'single.bin', num_chunks=8)
+        assert (folder / 'single.bin').read_bytes() == handler.data
+        assert len(handler.range_requests) == 0
+
+        # a failed chunk do not leave a partial file
+        handler.accept_ranges = True
+        handler.honor_ranges = False
+        with pytest.raises(AssertionError):
+            _parallel_download(url, folder / 'failed.bin', num_chunks=8)
+        assert not (folder / 'failed.bin').exists()
+        assert not (folder / 'failed.bin.part').exists()
+    finally:
+        handler.accept_ranges = True
+        handler.honor_ranges = True
+        server.shutdown()
+        server.server_close()
+
+
 if __name__ == '__main__':
     test_download_dataset()
-    
-
-    
\ No newline at end of file
+    test_parallel_download()
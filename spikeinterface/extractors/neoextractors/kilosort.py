@@ -1,9 +1,12 @@
+import ast
+import os
+from functools import lru_cache
+
 import numpy as np
-from pathlib import Path
 
-from .neobaseextractor import NeoBaseRecordingExtractor, NeoBaseSortingExtractor
+from spikeinterface.core import BaseSortingSegment
 
-import neo
+from .neobaseextractor import NeoBaseRecordingExtractor, NeoBaseSortingExtractor
 
 class KiloSortSortingExtractor(NeoBaseSortingExtractor):
     """
@@ -20,9 +23,8 @@ class KiloSortSortingExtractor(NeoBaseSortingExtractor):
         neo_kwargs = {'dirname' : folder_path}
         
         # sample rate is in "params.py"
-        d = {}
-        with open(Path(folder_path) / 'params.py') as f:
-            exec(f.read(), None, d)
+        params_file = os.path.join(os.fspath(folder_path), 'params.py')
+        d = _read_phy_params(params_file, os.path.getmtime(params_file))
         sampling_frequency = float(d['sample_rate'])
         
         if keep_good_only:
@@ -37,6 +39,112 @@ class KiloSortSortingExtractor(NeoBaseSortingExtractor):
         self._kwargs = dict(folder_path=folder_path, keep_good_only=keep_good_only,
             use_natural_unit_ids=use_natural_unit_ids)
 
+    def _make_sorting_segment(self, segment_index):
+        if not all(hasattr(self.neo_reader, attr) for attr in ('_spike_times', '_spike_clusters', 'unit_labels')):
+            # neo internals have changed: keep the generic neo reading
+            return NeoBaseSortingExtractor._make_sorting_segment(self, segment_index)
+
+        # spike_times.npy/spike_clusters.npy already loaded by neo are a dense spike vector:
+        # phy is mono segment so it is built once here and used for spike train reading
+        spike_vector = _get_phy_spike_vector(self.neo_reader)
+        return KiloSortSortingSegment(spike_vector, segment_index)
+
+
+class KiloSortSortingSegment(BaseSortingSegment):
+    def __init__(self, spike_vector, segment_index):
+        BaseSortingSegment.__init__(self)
+        keep = spike_vector['segment_index'] == segment_index
+        spike_frames = spike_vector['sample_index'][keep]
+        spike_units = spike_vector['unit_index'][keep]
+        # spike_vector is sorted by time so a stable sort by unit keeps
+        # each unit sorted by time: one unit is then a contiguous slice
+        order = np.argsort(spike_units, kind='stable')
+        self._spike_frames = spike_frames[order]
+        # unit boundaries are computed once: unit i is [bounds[i], bounds[i + 1]]
+        num_units = int(spike_vector['unit_index'].max()) + 1 if spike_vector.size > 0 else 0
+        self._unit_bounds = np.searchsorted(spike_units[order], np.arange(num_units + 1), side='left')
+        self._unit_id_to_index = None
+
+    def get_unit_spike_train(self, unit_id, start_frame, end_frame):
+        if self._unit_id_to_index is None:
+            unit_ids = self._parent_extractor().unit_ids
+            self._unit_id_to_index = {unit_id: unit_index for unit_index, unit_id in enumerate(unit_ids)}
+        unit_index = self._unit_id_to_index[unit_id]
+        spike_frames = self._spike_frames[self._unit_bounds[unit_index]:self._unit_bounds[unit_index + 1]]
+
+        # frames are sorted: clip with the same semantic as NeoSortingSegment
+        if start_frame is not None:
+            spike_frames = spike_frames[np.searchsorted(spike_frames, start_frame, side='left'):]
+
+        if end_frame is not None:
+            spike_frames = spike_frames[:np.searchsorted(spike_frames, end_frame, side='right')]
+
+        return spike_frames
+
+
+def _read_phy_params(params_file, mtime):
+    """
+    Parse the phy "params.py" file into a dict.
+
+    The parsing is cached on (params_file, mtime) so re-instantiating the
+    same sorting (for instance when reloading from _kwargs) do not parse
+    the file again unless it has been modified.
+    A copy is returned so callers can not modify the cached dict.
+    """
+    return dict(_parse_phy_params(params_file, mtime))
+
+
+@lru_cache(maxsize=128)
+def _parse_phy_params(params_file, mtime):
+    # params.py is a flat "key = literal" file: ast.literal_eval is enough and
+    # do not execute arbitrary code (contrary to exec)
+    d = {}
+    with open(params_file) as f:
+        for line in f:
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            try:
+                d[key.strip()] = ast.literal_eval(value.strip())
+            except (ValueError, SyntaxError):
+                # comments or non literal values
+                continue
+    return d
+
+
+def _get_phy_spike_vector(neo_reader):
+    """
+    Build a structured spike vector sorted by sample_index from the spike_times.npy
+    and spike_clusters.npy (or spike_templates.npy) arrays loaded by neo.rawio.PhyRawIO.
+    sample_index is int32 when all spike times fit in it and int64 otherwise.
+    unit_index follow the neo.rawio.PhyRawIO unit order (sorted cluster ids).
+    """
+    spike_times = np.asarray(neo_reader._spike_times).reshape(-1)
+    spike_clusters = np.asarray(neo_reader._spike_clusters).reshape(-1)
+
+    clust_ids = np.asarray(neo_reader.unit_labels)
+    unit_indices = np.searchsorted(clust_ids, spike_clusters)
+    if np.all(spike_times[1:] >= spike_times[:-1]):
+        # spike_times.npy is usually already sorted
+        order = slice(None)
+    else:
+        order = np.argsort(spike_times, kind='stable')
+
+    # spike_times.npy is uint64 but sessions rarely exceed 2**31 samples (~20h at 30kHz):
+    # use the smallest safe dtypes to halve the memory moved by downstream loops
+    if spike_times.size == 0 or spike_times.max() <= np.iinfo('int32').max:
+        sample_dtype = 'int32'
+    else:
+        sample_dtype = 'int64'
+    unit_dtype = 'int16' if clust_ids.size <= np.iinfo('int16').max else 'int32'
+    spike_dtype = [('sample_index', sample_dtype), ('unit_index', unit_dtype), ('segment_index', 'int16')]
+    spike_vector = np.zeros(spike_times.size, dtype=spike_dtype)
+    spike_vector['sample_index'] = spike_times[order]
+    spike_vector['unit_index'] = unit_indices[order]
+    # phy is always mono segment
+    spike_vector['segment_index'] = 0
+    return spike_vector
+
 
 def read_kilosort(*args, **kargs):
     sorting = KiloSortSortingExtractor(*args, **kargs)
@@ -1,10 +1,8 @@
 import numpy as np
 
-from .neobaseextractor import NeoBaseRecordingExtractor, NeoBaseSortingExtractor
+from spikeinterface.core.numpyextractors import NumpySortingSegment
 
-import neo
-
-import probeinterface as pi
+from .neobaseextractor import NeoBaseRecordingExtractor, NeoBaseSortingExtractor, get_neo_io_reader
 
 class MEArecRecordingExtractor(NeoBaseRecordingExtractor):
     """
@@ -17,15 +15,20 @@ class MEArecRecordingExtractor(NeoBaseRecordingExtractor):
     
     locs_2d: bool
     
+    neo_reader: neo.rawio.MEArecRawIO or None
+        An already parsed reader on the same file, to avoid re-opening it.
     """    
     mode = 'file'
     NeoRawIOClass = 'MEArecRawIO'
     
-    def __init__(self, file_path, locs_2d=True):
+    def __init__(self, file_path, locs_2d=True, neo_reader=None):
         
         neo_kwargs = {'filename' : file_path}
-        NeoBaseRecordingExtractor.__init__(self, **neo_kwargs)
+        NeoBaseRecordingExtractor.__init__(self, neo_reader=neo_reader, **neo_kwargs)
+        
+        _optimize_recordings_access(self.neo_reader, file_path)
         
+        import probeinterface as pi
         probe = pi.read_mearec(file_path)
         self.set_probe(probe, in_place=True)
         self.annotate(is_filtered=True)
@@ -39,17 +42,80 @@ class MEArecSortingExtractor(NeoBaseSortingExtractor):
     NeoRawIOClass = 'MEArecRawIO'
     handle_spike_frame_directly = False
     
-    def __init__(self, file_path, use_natural_unit_ids=True):
+    def __init__(self, file_path, use_natural_unit_ids=True, neo_reader=None):
         neo_kwargs = {'filename' : file_path}
         NeoBaseSortingExtractor.__init__(self, 
                     sampling_frequency=None, # auto guess is correct here
                     use_natural_unit_ids=use_natural_unit_ids,
+                    neo_reader=neo_reader,
                     **neo_kwargs)
-        
+
         self._kwargs = {'file_path' : str(file_path), 'use_natural_unit_ids': use_natural_unit_ids}
 
+    def _make_sorting_segment(self, segment_index):
+        # MEArec spike times are sample aligned: they are converted to frames once here
+        # instead of doing the float conversion at every get_unit_spike_train() call
+        fs = self.get_sampling_frequency()
+        t_start = self.neo_reader.get_signal_t_start(0, segment_index)
+        units_dict = {}
+        for unit_index, unit_id in enumerate(self.unit_ids):
+            spike_timestamps = self.neo_reader.get_spike_timestamps(block_index=0,
+                                                                    seg_index=segment_index,
+                                                                    spike_channel_index=unit_index)
+            spike_times = self.neo_reader.rescale_spike_timestamp(spike_timestamps, dtype='float64')
+            units_dict[unit_id] = np.round((spike_times - t_start) * fs).astype('int64')
+        return NumpySortingSegment(units_dict)
+
+
+def _optimize_recordings_access(neo_reader, file_path, rdcc_nbytes=128 * 1024 * 1024,
+                                rdcc_nslots=1_000_003, rdcc_w0=0.75):
+    """
+    Swap the h5py "recordings" dataset used by neo.rawio.MEArecRawIO by a faster
+    accessor with the same shape and slicing semantic:
+      * a np.memmap when the dataset is contiguous and not compressed (zero copy)
+      * otherwise the same dataset re-opened on neo's file handle with a larger
+        chunk cache, the default 1MB h5py chunk cache is far too small for
+        chunked recordings.
+    """
+    import h5py
+
+    dset = getattr(neo_reader, '_recordings', None)
+    if not isinstance(dset, h5py.Dataset):
+        # neo internals have changed: keep the default access
+        return
+
+    if dset.chunks is None and dset.compression is None:
+        offset = dset.id.get_offset()
+        # offset is None when the dataset storage is not allocated
+        if offset is not None:
+            neo_reader._recordings = np.memmap(str(file_path), dtype=dset.dtype, mode='r',
+                                               offset=offset, shape=dset.shape, order='C')
+            return
+
+    # the file is already opened by neo: h5py.File(..., rdcc_nbytes=...) would give back
+    # the same HDF5 file with its existing cache, so the cache is set per dataset instead.
+    # HDF5 keeps the chunk cache of the first opened handle of a dataset, so all handles
+    # on "recordings" (neo and the MEArec RecordingGenerator) are released before re-opening it.
+    file_id = dset.file.id
+    name = dset.name.encode()
+    recgen = getattr(neo_reader, '_recgen', None)
+    if getattr(recgen, 'recordings', None) is dset:
+        recgen.recordings = None
+    neo_reader._recordings = None
+    del dset
+
+    dapl = h5py.h5p.create(h5py.h5p.DATASET_ACCESS)
+    dapl.set_chunk_cache(rdcc_nslots, rdcc_nbytes, rdcc_w0)
+    recordings = h5py.Dataset(h5py.h5d.open(file_id, name, dapl))
+    neo_reader._recordings = recordings
+    if recgen is not None:
+        recgen.recordings = recordings
+
 
 def read_mearec(file_path, locs_2d=True, use_natural_unit_ids=True):
-    recording = MEArecRecordingExtractor(file_path, locs_2d=locs_2d)
-    sorting = MEArecSortingExtractor(file_path, use_natural_unit_ids=use_natural_unit_ids)
+    # open and parse the file only once for both extractors
+    neo_reader = get_neo_io_reader(MEArecRecordingExtractor.NeoRawIOClass, filename=file_path)
+    recording = MEArecRecordingExtractor(file_path, locs_2d=locs_2d, neo_reader=neo_reader)
+    sorting = MEArecSortingExtractor(file_path, use_natural_unit_ids=use_natural_unit_ids,
+                                     neo_reader=neo_reader)
     return recording, sorting
@@ -5,15 +5,29 @@ from typing import Union, List
 import neo
 
 
+def get_neo_io_reader(raw_class, **neo_kwargs):
+    """
+    Instantiate a neo.rawio class and parse its header.
+
+    The returned reader can be given with neo_reader= to several extractors
+    that read the same file (for instance recording + sorting) to avoid
+    opening and parsing it twice.
+    """
+    neoIOclass = eval('neo.rawio.' + raw_class)
+    neo_reader = neoIOclass(**neo_kwargs)
+    neo_reader.parse_header()
+    return neo_reader
+
+
 class _NeoBaseExtractor:
     NeoRawIOClass = None
     installed = True
     is_writable = False
 
-    def __init__(self, **neo_kwargs):
-        neoIOclass = eval('neo.rawio.' + self.NeoRawIOClass)
-        self.neo_reader = neoIOclass(**neo_kwargs)
-        self.neo_reader.parse_header()
+    def __init__(self, neo_reader=None, **neo_kwargs):
+        if neo_reader is None:
+            neo_reader = get_neo_io_reader(self.NeoRawIOClass, **neo_kwargs)
+        self.neo_reader = neo_reader
 
         assert self.neo_reader.block_count() == 1, \
             'This file is neo multi block spikeinterface support one block only dataset'
@@ -21,9 +35,9 @@ class _NeoBaseExtractor:
 
 class NeoBaseRecordingExtractor(_NeoBaseExtractor, BaseRecording):
 
-    def __init__(self, stream_id=None, **neo_kwargs):
+    def __init__(self, stream_id=None, neo_reader=None, **neo_kwargs):
 
-        _NeoBaseExtractor.__init__(self, **neo_kwargs)
+        _NeoBaseExtractor.__init__(self, neo_reader=neo_reader, **neo_kwargs)
 
         # check channel
         # TODO propose a meachanisim to select the appropriate channel groups
@@ -116,8 +130,8 @@ class NeoBaseSortingExtractor(_NeoBaseExtractor, BaseSorting):
     # this will depend on each reader
     handle_spike_frame_directly = True
 
-    def __init__(self, sampling_frequency=None, use_natural_unit_ids=False, **neo_kwargs):
-        _NeoBaseExtractor.__init__(self, **neo_kwargs)
+    def __init__(self, sampling_frequency=None, use_natural_unit_ids=False, neo_reader=None, **neo_kwargs):
+        _NeoBaseExtractor.__init__(self, neo_reader=neo_reader, **neo_kwargs)
 
         self.use_natural_unit_ids = use_natural_unit_ids
 
@@ -137,15 +151,23 @@ class NeoBaseSortingExtractor(_NeoBaseExtractor, BaseSorting):
 
         nseg = self.neo_reader.segment_count(block_index=0)
         for segment_index in range(nseg):
-            if self.handle_spike_frame_directly:
-                t_start = None
-            else:
-                t_start = self.neo_reader.get_signal_t_start(0, segment_index)
-
-            sorting_segment = NeoSortingSegment(self.neo_reader, segment_index,
-                                                self.use_natural_unit_ids, t_start, sampling_frequency)
+            sorting_segment = self._make_sorting_segment(segment_index)
             self.add_sorting_segment(sorting_segment)
 
+    def _make_sorting_segment(self, segment_index):
+        """
+        Construct the sorting segment of segment_index.
+        Sub classes can overwrite this to read spikes in a more efficient way than
+        the generic NeoSortingSegment.
+        """
+        if self.handle_spike_frame_directly:
+            t_start = None
+        else:
+            t_start = self.neo_reader.get_signal_t_start(0, segment_index)
+
+        return NeoSortingSegment(self.neo_reader, segment_index,
+                                 self.use_natural_unit_ids, t_start, self.get_sampling_frequency())
+
     def _auto_guess_sampling_frequency(self):
         """
         Because neo handle spike in times (s or ms) but spikeinterface in frames related to signals.
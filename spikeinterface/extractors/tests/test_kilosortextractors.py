@@ -0,0 +1,84 @@
+import shutil
+from pathlib import Path
+
+import pytest
+import numpy as np
+
+from spikeinterface.extractors import KiloSortSortingExtractor
+from spikeinterface.extractors.neoextractors.kilosort import _read_phy_params, KiloSortSortingSegment
+from spikeinterface.extractors.neoextractors.neobaseextractor import NeoSortingSegment
+
+
+def _make_phy_folder(folder, spike_times, spike_clusters):
+    folder = Path(folder)
+    if folder.is_dir():
+        shutil.rmtree(folder)
+    folder.mkdir()
+    np.save(folder / 'spike_times.npy', spike_times.astype('uint64').reshape(-1, 1))
+    np.save(folder / 'spike_clusters.npy', spike_clusters.astype('int32'))
+    np.save(folder / 'spike_templates.npy', spike_clusters.astype('int32'))
+    with open(folder / 'params.py', 'w') as f:
+        f.write("# phy params generated for test\n")
+        f.write("dat_path = 'raw.dat'\n")
+        f.write("n_channels_dat = 32 + 2\n")
+        f.write("dtype = 'int16'\n")
+        f.write("offset = 0\n")
+        f.write("sample_rate = 30000.\n")
+        f.write("hp_filtered = False\n")
+    return folder
+
+
+def test_kilosort_sorting_extractor():
+    rng = np.random.default_rng(seed=0)
+    num_spikes = 2000
+    spike_clusters = rng.choice([0, 2, 3, 7, 12], size=num_spikes)
+    # spike_times.npy is sorted in a plain kilosort output but not always after phy curation
+    for sort_times in (True, False):
+        spike_times = rng.integers(0, 300000, size=num_spikes)
+        if sort_times:
+            spike_times = np.sort(spike_times)
+        folder = _make_phy_folder('phy_kilosort_test', spike_times, spike_clusters)
+
+        d = _read_phy_params(str(folder / 'params.py'), 0.)
+        assert d['sample_rate'] == 30000.
+        assert d['dat_path'] == 'raw.dat'
+        assert 'n_channels_dat' not in d
+        # the cached parsing is not modified by callers
+        d['sample_rate'] = 1.
+        assert _read_phy_params(str(folder / 'params.py'), 0.)['sample_rate'] == 30000.
+
+        for use_natural_unit_ids in (True, False):
+            sorting = KiloSortSortingExtractor(folder, use_natural_unit_ids=use_natural_unit_ids)
+            assert sorting.get_sampling_frequency() == 30000.
+            assert sorting.get_num_units() == 5
+
+            neo_segment = NeoSortingSegment(sorting.neo_reader, 0, use_natural_unit_ids, None, 30000.)
+            neo_segment.set_parent_extractor(sorting)
+            for unit_id in sorting.unit_ids:
+                for start_frame, end_frame in [(None, None), (None, 150000), (1000, None),
+                                               (1000, 150000), (spike_times[5], spike_times[5])]:
+                    spike_train = sorting.get_unit_spike_train(unit_id, start_frame=start_frame,
+                                                               end_frame=end_frame)
+                    expected = neo_segment.get_unit_spike_train(unit_id, start_frame, end_frame).ravel()
+                    # neo keeps the file order, spike trains are sorted by time
+                    expected = np.sort(expected)
+                    assert spike_train.dtype == np.dtype('int32')
+                    assert np.array_equal(spike_train, expected)
+
+
+def test_kilosort_sorting_extractor_neo_fallback():
+    spike_times = np.array([5, 20, 30, 100])
+    spike_clusters = np.array([1, 0, 1, 1])
+    folder = _make_phy_folder('phy_kilosort_fallback_test', spike_times, spike_clusters)
+    sorting = KiloSortSortingExtractor(folder)
+    assert isinstance(sorting._sorting_segments[0], KiloSortSortingSegment)
+
+    # neo.rawio.PhyRawIO private arrays are not available: generic neo reading
+    del sorting.neo_reader._spike_times
+    segment = sorting._make_sorting_segment(0)
+    assert isinstance(segment, NeoSortingSegment)
+
+
+if __name__ == '__main__':
+    test_kilosort_sorting_extractor()
+    test_kilosort_sorting_extractor_neo_fallback()
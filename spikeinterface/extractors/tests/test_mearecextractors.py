@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+
+from spikeinterface.extractors import MEArecRecordingExtractor, MEArecSortingExtractor, read_mearec
+
+try:
+    import h5py
+    import neo
+    import quantities as pq
+    import MEArec as mr
+    HAVE_MEAREC = True
+except ImportError:
+    HAVE_MEAREC = False
+
+
+def _make_mearec_file(file_path, compressed=False, spike_times=None):
+    fs = 32000.
+    duration = 1.
+    num_channels = 8
+    rng = np.random.default_rng(seed=0)
+    traces = rng.normal(size=(int(fs * duration), num_channels)).astype('float32')
+    if spike_times is None:
+        spike_times = [np.sort(rng.integers(0, traces.shape[0], size=50)) / fs for _ in range(3)]
+    spiketrains = [neo.SpikeTrain(times * pq.s, t_start=0 * pq.s, t_stop=duration * pq.s, name=f'#{i}',
+                                  cell_type='E')
+                   for i, times in enumerate(spike_times)]
+    info = {
+        'recordings': {'fs': fs, 'duration': duration, 'dtype': 'float32', 'filter': True},
+        'electrodes': {'electrode_name': 'test', 'plane': 'yz', 'shape': 'square', 'size': 5.,
+                       'sortlist': None, 'description': 'test', 'dim': [num_channels]},
+        'spiketrains': {'duration': duration},
+    }
+    rec_dict = {'recordings': traces, 'spiketrains': spiketrains,
+                'channel_positions': rng.random((num_channels, 3)) * 100.,
+                'timestamps': np.arange(traces.shape[0]) / fs}
+    recgen = mr.RecordingGenerator(rec_dict=rec_dict, info=info)
+    recgen.gain_to_uV = None
+    mr.save_recording_generator(recgen, str(file_path), verbose=False)
+
+    if compressed:
+        with h5py.File(file_path, mode='a') as f:
+            attrs = dict(f['recordings'].attrs)
+            del f['recordings']
+            f.create_dataset('recordings', data=traces, chunks=(1024, num_channels), compression='gzip')
+            f['recordings'].attrs.update(attrs)
+    return traces
+
+
+@pytest.mark.skipif(not HAVE_MEAREC, reason='MEArec not installed')
+def test_mearec_recording_access():
+    for compressed in (False, True):
+        file_path = f'mearec_test_{"compressed" if compressed else "contiguous"}.h5'
+        traces = _make_mearec_file(file_path, compressed=compressed)
+
+        recording = MEArecRecordingExtractor(file_path)
+        recordings = recording.neo_reader._recordings
+        if compressed:
+            # same dataset re-opened with a large chunk cache
+            assert isinstance(recordings, h5py.Dataset)
+            assert recordings.id.get_access_plist().get_chunk_cache() == (1_000_003, 128 * 1024 * 1024, 0.75)
+            assert recording.neo_reader._recgen.recordings is recordings
+        else:
+            assert isinstance(recordings, np.memmap)
+
+        with h5py.File(file_path, mode='r') as f:
+            assert f['recordings'].compression == ('gzip' if compressed else None)
+            expected = f['recordings'][()]
+        assert np.array_equal(expected, traces)
+        assert np.array_equal(recording.get_traces(), expected)
+        channel_ids = recording.channel_ids[[1, 5, 6]]
+        assert np.array_equal(recording.get_traces(start_frame=100, end_frame=5000, channel_ids=channel_ids),
+                              expected[100:5000, [1, 5, 6]])
+
+        # recording and sorting share one reader
+        recording, sorting = read_mearec(file_path)
+        assert recording.neo_reader is sorting.neo_reader
+        assert np.array_equal(recording.get_traces(start_frame=100, end_frame=5000), expected[100:5000])
+        assert sorting.get_num_units() == 3
+
+
+@pytest.mark.skipif(not HAVE_MEAREC, reason='MEArec not installed')
+def test_mearec_sorting_frames():
+    fs = 32000.
+    rng = np.random.default_rng(seed=1)
+    # times are not always exactly on a sample: frames are rounded and not truncated
+    spike_times = [(np.sort(rng.choice(30000, size=40, replace=False)) + offsets) / fs
+                   for offsets in (np.zeros(40), np.full(40, 0.3), np.full(40, 0.7))]
+    file_path = 'mearec_test_sorting.h5'
+    _make_mearec_file(file_path, spike_times=spike_times)
+
+    sorting = MEArecSortingExtractor(file_path)
+    for unit_index, unit_id in enumerate(sorting.unit_ids):
+        spike_frames = sorting.get_unit_spike_train(unit_id)
+        assert spike_frames.dtype == np.dtype('int64')
+        assert np.array_equal(spike_frames, np.round(spike_times[unit_index] * fs).astype('int64'))
+
+
+if __name__ == '__main__':
+    test_mearec_recording_access()
+    test_mearec_sorting_frames()
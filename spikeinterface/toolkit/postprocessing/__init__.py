@@ -14,4 +14,5 @@ from .principal_component import (WaveformPrincipalComponent,
     
 from .unit_amplitudes import get_unit_amplitudes
 
-from .correlograms import compute_correlograms
\ No newline at end of file
+from .correlograms import compute_correlograms
+from .isi import compute_isi_histograms
@@ -1,22 +1,50 @@
 import numpy as np
 
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 
 def compute_correlograms(sorting, 
                     window_ms=100.0, bin_ms=1.0,
-                    symmetrize=False):
+                    symmetrize=False, method='auto'):
     """
     Compute several cross-correlogram in one course
     from sevral cluster.
     
-    This very elegant implementation is copy from phy package written by Cyril Rossant.
+    The 'numpy' method is a very elegant implementation copied from phy package written by Cyril Rossant.
     https://github.com/cortex-lab/phylib/blob/master/phylib/stats/ccg.py
     
     Some sligh modification have been made to fit spikeinterface
     data model because there are several segments handling in spikeinterface.
     
     Adaptation: Samuel Garcia
+
+    The 'numba' method loops once over the sorted spikes of each segment and stops
+    the inner loop as soon as the lag exceeds the window: O(num_spikes * spikes_in_window)
+    instead of one full vectorized pass per shift.
+
+    Parameters
+    ----------
+    sorting: SortingExtractor
+        The sorting extractor object
+    window_ms: float
+        Window duration in ms
+    bin_ms: float
+        Bin duration in ms
+    symmetrize: bool
+        Make symetric CCG
+    method: 'auto', 'numpy' or 'numba'
+        'auto' use numba when installed and numpy otherwise
     """
+    if method == 'auto':
+        method = 'numba' if HAVE_NUMBA else 'numpy'
+    assert method in ('numpy', 'numba'), f'method {method} is not numpy or numba'
+    if method == 'numba':
+        assert HAVE_NUMBA, 'You need to install numba for method="numba"'
+
     num_seg = sorting.get_num_segments()
     num_units = len(sorting.unit_ids)
     spikes = sorting.get_all_spike_trains(outputs='unit_index')
@@ -37,43 +65,12 @@ def compute_correlograms(sorting,
     
     for seg_index in range(num_seg):
         spike_times, spike_labels = spikes[seg_index]
-
-        # At a given shift, the mask precises which spikes have matching spikes
-        # within the correlogram time window.
-        mask = np.ones_like(spike_times, dtype='bool')
-
-        # The loop continues as long as there is at least one spike with
-        # a matching spike.
-        shift = 1
-        while mask[:-shift].any():
-            # Number of time samples between spike i and spike i+shift.
-            #~ spike_diff = _diff_shifted(spike_indexes, shift)
-            spike_diff = spike_times[shift:] - spike_times[:len(spike_times) - shift]
-            
-            # Binarize the delays between spike i and spike i+shift.
-            spike_diff_b = spike_diff // bin_size
-
-            # Spikes with no matching spikes are masked.
-            mask[:-shift][spike_diff_b > (num_half_bins -1)] = False
-
-            # Cache the masked spike delays.
-            m = mask[:-shift].copy()
-            d = spike_diff_b[m]
-            #~ d = d.astype('int32')
-
-            # Find the indices in the raveled correlograms array that need
-            # to be incremented, taking into account the spike clusters.
-            indices = np.ravel_multi_index((spike_labels[:-shift][m],
-                                            spike_labels[+shift:][m],
-                                            d),
-                                           correlograms.shape)
-
-            # Increment the matching spikes in the correlograms array.
-            bbins = np.bincount(indices)
-            correlograms.ravel()[:len(bbins)] += bbins
-            
-            
-            shift += 1
+        if method == 'numpy':
+            _compute_correlograms_numpy(correlograms, spike_times, spike_labels,
+                                        num_half_bins, bin_size)
+        elif method == 'numba':
+            _compute_correlograms_numba(correlograms, spike_times.astype('int64'),
+                                        spike_labels.astype('int64'), num_half_bins, bin_size)
 
         # Remove ACG peaks.
         correlograms[np.arange(num_units),
@@ -95,4 +92,68 @@ def compute_correlograms(sorting,
         bins = np.arange(correlograms.shape[2]+1) * real_bin_duration_ms
     
     return correlograms, bins
-    
\ No newline at end of file
+
+
+def _compute_correlograms_numpy(correlograms, spike_times, spike_labels, num_half_bins, bin_size):
+    """
+    Accumulate in place in correlograms the positive lags of one segment.
+    """
+    # At a given shift, the mask precises which spikes have matching spikes
+    # within the correlogram time window.
+    mask = np.ones_like(spike_times, dtype='bool')
+
+    # The loop continues as long as there is at least one spike with
+    # a matching spike.
+    shift = 1
+    while mask[:-shift].any():
+        # Number of time samples between spike i and spike i+shift.
+        #~ spike_diff = _diff_shifted(spike_indexes, shift)
+        spike_diff = spike_times[shift:] - spike_times[:len(spike_times) - shift]
+        
+        # Binarize the delays between spike i and spike i+shift.
+        spike_diff_b = spike_diff // bin_size
+
+        # Spikes with no matching spikes are masked.
+        mask[:-shift][spike_diff_b > (num_half_bins -1)] = False
+
+        # Cache the masked spike delays.
+        m = mask[:-shift].copy()
+        d = spike_diff_b[m]
+        #~ d = d.astype('int32')
+
+        # Find the indices in the raveled correlograms array that need
+        # to be incremented, taking into account the spike clusters.
+        indices = np.ravel_multi_index((spike_labels[:-shift][m],
+                                        spike_labels[+shift:][m],
+                                        d),
+                                       correlograms.shape)
+
+        # Increment the matching spikes in the correlograms array.
+        bbins = np.bincount(indices)
+        correlograms.ravel()[:len(bbins)] += bbins
+        
+        
+        shift += 1
+
+
+if HAVE_NUMBA:
+    @numba.jit(nopython=True, nogil=True, cache=True, fastmath=True)
+    def _compute_correlograms_numba(correlograms, spike_times, spike_labels, num_half_bins, bin_size):
+        num_spikes = spike_times.size
+        # loop invariants: the window test is done on the raw lag and the integer
+        # division by bin_size is replaced by a multiplication + exact correction
+        max_diff = num_half_bins * bin_size - 1
+        inv_bin_size = 1. / bin_size
+        for i in range(num_spikes):
+            for j in range(i + 1, num_spikes):
+                # spike_times is sorted so lags only grow with j
+                diff = spike_times[j] - spike_times[i]
+                if diff > max_diff:
+                    break
+                d = int(diff * inv_bin_size)
+                # fix float rounding so that d == diff // bin_size
+                if d * bin_size > diff:
+                    d -= 1
+                elif (d + 1) * bin_size <= diff:
+                    d += 1
+                correlograms[spike_labels[i], spike_labels[j], d] += 1
@@ -0,0 +1,69 @@
+import numpy as np
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def compute_isi_histograms(sorting, window_ms=50.0, bin_ms=1.0, method='auto'):
+    """
+    Compute the inter-spike interval histograms of all units.
+    Counts are summed over segments.
+
+    Parameters
+    ----------
+    sorting: SortingExtractor
+        The sorting extractor object
+    window_ms: float
+        Window duration in ms
+    bin_ms: float
+        Bin duration in ms
+    method: 'auto', 'numpy' or 'numba'
+        'auto' use numba when installed and numpy otherwise
+
+    Returns
+    -------
+    isi_histograms: np.array
+        ISI histograms with shape (num_units, num_bins)
+    bins: np.array
+        The bins edges in ms
+    """
+    if method == 'auto':
+        method = 'numba' if HAVE_NUMBA else 'numpy'
+    assert method in ('numpy', 'numba'), f'method {method} is not numpy or numba'
+    if method == 'numba':
+        assert HAVE_NUMBA, 'You need to install numba for method="numba"'
+
+    fs = sorting.get_sampling_frequency()
+    num_units = len(sorting.unit_ids)
+
+    window_size = int(fs * window_ms / 1000.)
+    bin_size = int(fs * bin_ms / 1000.)
+    num_bins = max(int(window_size / bin_size), 1)
+    real_bin_duration_ms = bin_size / fs * 1000.
+    bins = np.arange(num_bins + 1) * real_bin_duration_ms
+
+    isi_histograms = np.zeros((num_units, num_bins), dtype='int64')
+    for segment_index in range(sorting.get_num_segments()):
+        for unit_index, unit_id in enumerate(sorting.unit_ids):
+            spike_train = sorting.get_unit_spike_train(unit_id, segment_index=segment_index)
+            spike_train = np.asarray(spike_train, dtype='int64')
+            if method == 'numpy':
+                isi = np.diff(spike_train) // bin_size
+                isi = isi[isi < num_bins]
+                isi_histograms[unit_index, :] += np.bincount(isi, minlength=num_bins)
+            elif method == 'numba':
+                _compute_isi_histogram_numba(isi_histograms[unit_index], spike_train, num_bins, bin_size)
+
+    return isi_histograms, bins
+
+
+if HAVE_NUMBA:
+    @numba.jit(nopython=True, nogil=True, cache=True)
+    def _compute_isi_histogram_numba(isi_histogram, spike_train, num_bins, bin_size):
+        for i in range(spike_train.size - 1):
+            d = (spike_train[i + 1] - spike_train[i]) // bin_size
+            if d < num_bins:
+                isi_histogram[d] += 1
@@ -4,6 +4,7 @@ import numpy as np
 from spikeinterface import download_dataset, extract_waveforms
 import spikeinterface.extractors as se
 from spikeinterface.toolkit import compute_correlograms
+from spikeinterface.toolkit.postprocessing.correlograms import HAVE_NUMBA
     
     
 def test_compute_correlograms():
@@ -16,7 +17,20 @@ def test_compute_correlograms():
     unit_ids = sorting.unit_ids
     sorting2 = sorting.select_units(unit_ids[:3])
     correlograms, bins = compute_correlograms(sorting2)
-    
+
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason='numba not installed')
+def test_compute_correlograms_methods():
+    recording, sorting = se.toy_example(duration=30, num_channels=4, seed=0, num_segments=2)
+    for symmetrize in (False, True):
+        ccg_numpy, bins_numpy = compute_correlograms(sorting, window_ms=100., bin_ms=2.,
+                                                     symmetrize=symmetrize, method='numpy')
+        ccg_numba, bins_numba = compute_correlograms(sorting, window_ms=100., bin_ms=2.,
+                                                     symmetrize=symmetrize, method='numba')
+        assert np.array_equal(ccg_numpy, ccg_numba)
+        assert np.array_equal(bins_numpy, bins_numba)
+
 
 if __name__ == '__main__':
     test_compute_correlograms()
+    test_compute_correlograms_methods()
@@ -0,0 +1,42 @@
+import pytest
+import numpy as np
+
+from spikeinterface import NumpySorting
+import spikeinterface.extractors as se
+from spikeinterface.toolkit import compute_isi_histograms
+from spikeinterface.toolkit.postprocessing.isi import HAVE_NUMBA
+
+
+def test_compute_isi_histograms():
+    recording, sorting = se.toy_example(duration=30, num_channels=4, seed=0, num_segments=2)
+    isi_histograms, bins = compute_isi_histograms(sorting, window_ms=50., bin_ms=1., method='numpy')
+    assert isi_histograms.shape == (sorting.get_num_units(), bins.size - 1)
+
+    if HAVE_NUMBA:
+        isi_histograms_numba, bins_numba = compute_isi_histograms(sorting, window_ms=50., bin_ms=1.,
+                                                                  method='numba')
+        assert np.array_equal(isi_histograms, isi_histograms_numba)
+        assert np.array_equal(bins, bins_numba)
+
+
+def test_compute_isi_histograms_values():
+    # 10 samples per 1 ms bin, 5 bins
+    units_dict_list = [
+        {0: np.array([0, 5, 15, 40, 100]), 1: np.array([10, 10, 59])},
+        {0: np.array([3, 12]), 1: np.array([], dtype='int64')},
+    ]
+    sorting = NumpySorting.from_dict(units_dict_list, sampling_frequency=10000.)
+    # unit 0: isi 5, 10, 25, (60 out of window) in segment 0 and 9 in segment 1
+    # unit 1: isi 0 (coincident spikes) and 49
+    expected = np.array([[2, 1, 1, 0, 0],
+                         [1, 0, 0, 0, 1]])
+    methods = ['numpy', 'numba'] if HAVE_NUMBA else ['numpy']
+    for method in methods:
+        isi_histograms, bins = compute_isi_histograms(sorting, window_ms=5., bin_ms=1., method=method)
+        assert np.array_equal(isi_histograms, expected)
+        assert np.allclose(bins, [0., 1., 2., 3., 4., 5.])
+
+
+if __name__ == '__main__':
+    test_compute_isi_histograms()
+    test_compute_isi_histograms_values()
@@ -2,10 +2,14 @@ import numpy as np
 from matplotlib import pyplot as plt
 from .basewidget import BaseMultiWidget
 
+from spikeinterface.toolkit import compute_isi_histograms
+
 
 class ISIDistributionWidget(BaseMultiWidget):
     """
-    Plots spike train ISI distribution.
+    Plots spike train ISI distribution, one histogram per unit.
+    For multi segment sorting, the ISI of all segments are summed in a single
+    histogram (normalized as a density).
 
     Parameters
     ----------
@@ -13,73 +17,64 @@ class ISIDistributionWidget(BaseMultiWidget):
         The sorting extractor object
     unit_ids: list
         List of unit ids
-    bins: int
-        Number of bins
-    window: float
-        Window size in s
+    window_ms: float
+        Window duration in ms
+    bin_ms: float
+        Bin duration in ms
+    method: 'auto', 'numpy' or 'numba'
+        Method used by compute_isi_histograms()
     figure: matplotlib figure
-        The figure to be used. If not given a figure is created
+        Ignored, the figure of axes is used
     ax: matplotlib axis
-        The axis to be used. If not given an axis is created
+        Ignored, one axis per unit is needed (see axes)
     axes: list of matplotlib axes
-        The axes to be used for the individual plots. If not given the required axes are created. If provided, the ax
-        and figure parameters are ignored
+        One axis per unit. If not given, a figure with one row per unit is created
 
     Returns
     -------
     W: ISIDistributionWidget
         The output widget
     """
-    def __init__(self, sorting, unit_ids=None, window_ms=100.0, bin_ms=1.0, 
+    def __init__(self, sorting, unit_ids=None, window_ms=100.0, bin_ms=1.0, method='auto',
         figure=None, ax=None, axes=None):
-        BaseMultiWidget.__init__(self, figure, ax, axes)
+        if unit_ids is not None:
+            sorting = sorting.select_units(unit_ids)
+        if axes is None:
+            n = len(sorting.unit_ids)
+            figure, axes = plt.subplots(nrows=n, ncols=1, sharex=True, squeeze=False)
+        BaseMultiWidget.__init__(self, figure, None, axes)
         self._sorting = sorting
-        self._unit_ids = unit_ids
         self._sampling_frequency = sorting.get_sampling_frequency()
         self.window_ms = window_ms
         self.bin_ms = bin_ms
+        self.method = method
         self.name = 'ISIDistribution'
 
     def plot(self):
         self._do_plot()
 
     def _do_plot(self):
-        unit_ids = self._unit_ids
-        if unit_ids is None:
-            unit_ids = self._sorting.get_unit_ids()
-        num_seg = self._sorting.get_num_segments()
-        nrows, ncols = len(unit_ids), num_seg
-        num_ax = 0
+        sorting = self._sorting
+        unit_ids = sorting.unit_ids
+
+        # all units and segments in one pass
+        isi_histograms, bins = compute_isi_histograms(sorting, window_ms=self.window_ms,
+                                                      bin_ms=self.bin_ms, method=self.method)
+        bin_width = bins[1] - bins[0]
+
+        nrows, ncols = len(unit_ids), 1
         for i, unit_id in enumerate(unit_ids):
-            for segment_index in range(num_seg):
-                ax = self.get_tiled_ax(num_ax, nrows, ncols)
-                times_ms = self._sorting.get_unit_spike_train(unit_id=unit_id, segment_index=segment_index) \
-                        / float(self._sampling_frequency) *1000.
-                # bin_counts, bin_edges = compute_isi_dist(times, bins=self._bins, maxwindow=self._window)
-                isi = np.diff(times_ms)
-                bins = np.arange(0, self.window_ms, self.bin_ms)
-                bin_counts, bin_edges = np.histogram(isi, bins=bins, density=True)
-                
-                ax.bar(x=bin_edges[:-1], height=bin_counts, width=self.bin_ms, color='gray', align='edge')
-
-                #~ with plt.rc_context({'axes.edgecolor': 'gray'}):
-                    #~ _plot_isi(bin_counts=bin_counts, bin_edges=bin_edges, ax=ax,
-                              #~ xticks=[0, self._window / 2, self._window])
-                # if i == 0:
-                #     ax.set_ylabel(f'segment {segment_index}')
-                # if segment_index == num_seg - 1:
-                #     ax.set_xlabel('Times [s]')
-                # if segment_index == 0:
-                #     ax.set_title(f'{unit_id}')
-                if i == 0:
-                    ax.set_title(f'segment {segment_index}')
-                if i == len(unit_ids) - 1:
-                    ax.set_xlabel('Times [ms]')
-                if segment_index == 0:
-                    ax.set_ylabel(f'{unit_id}')
-                # ax.set_title(f"AXES {num_ax}")
-                num_ax += 1
+            ax = self.get_tiled_ax(i, nrows, ncols)
+            counts = isi_histograms[i]
+            total = np.sum(counts)
+            if total > 0:
+                # density, same as np.histogram(density=True)
+                counts = counts / (total * bin_width)
+            ax.bar(x=bins[:-1], height=counts, width=bin_width, color='gray', align='edge')
 
+            if i == len(unit_ids) - 1:
+                ax.set_xlabel('Times [ms]')
+            ax.set_ylabel(f'{unit_id}')
 
 
 def plot_isi_distribution(*args, **kwargs):
@@ -75,21 +75,37 @@ class RasterWidget(BaseWidget):
         if units_ids is None:
             units_ids = self._sorting.get_unit_ids()
 
+        # all ticks are drawn with a single Line2D: each spike is a vertical segment
+        # (t, t, nan) / (y_lo, y_hi, nan), the nan breaking the line between spikes
+        all_x = []
+        all_y = []
+        for u_i, unit_id in enumerate(units_ids):
+            spiketrain = self._sorting.get_unit_spike_train(unit_id,
+                        start_frame=self._visible_trange[0],
+                        end_frame=self._visible_trange[1])
+            spiketimes = spiketrain / float(self._sampling_frequency)
+            x = np.empty((spiketimes.size, 3), dtype='float64')
+            x[:, 0] = spiketimes
+            x[:, 1] = spiketimes
+            x[:, 2] = np.nan
+            y = np.empty((spiketimes.size, 3), dtype='float64')
+            y[:, 0] = u_i - 0.3
+            y[:, 1] = u_i + 0.3
+            y[:, 2] = np.nan
+            all_x.append(x.ravel())
+            all_y.append(y.ravel())
+
         with plt.rc_context({'axes.edgecolor': 'gray'}):
-            for u_i, unit_id in enumerate(units_ids):
-                spiketrain = self._sorting.get_unit_spike_train(unit_id, 
-                            start_frame=self._visible_trange[0],
-                            end_frame=self._visible_trange[1])
-                spiketimes =  spiketrain / float(self._sampling_frequency)
-                self.ax.plot(spiketimes, u_i * np.ones_like(spiketimes),
-                            marker='|', mew=1, markersize=3,
-                            ls='', color=self._color)
+            ax = self.ax
+            if len(all_x) > 0:
+                ax.plot(np.concatenate(all_x), np.concatenate(all_y),
+                        ls='-', lw=1, color=self._color)
             visible_start_frame = self._visible_trange[0] / self._sampling_frequency
             visible_end_frame = self._visible_trange[1] / self._sampling_frequency
-            self.ax.set_yticks(np.arange(len(units_ids)))
-            self.ax.set_yticklabels(units_ids)
-            self.ax.set_xlim(visible_start_frame, visible_end_frame)
-            self.ax.set_xlabel('time (s)')
+            ax.set_yticks(np.arange(len(units_ids)))
+            ax.set_yticklabels(units_ids)
+            ax.set_xlim(visible_start_frame, visible_end_frame)
+            ax.set_xlabel('time (s)')
 
     def _fix_trange(self, trange):
         if trange[1] > self._max_frame: